@@ -13,9 +13,39 @@ genuine driver performance in changing wet conditions.
 import fastf1
 import pandas as pd
 import numpy as np
+import hashlib
 import os
 from datetime import timedelta
 
+# Optional accelerator: polars runs the lap-adjustment pipeline as a single
+# fused, multithreaded lazy query when available
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Optional accelerator: numba JIT-compiles the adjustment kernel into a
+# parallel SIMD loop over raw arrays
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Optional accelerator: numexpr fuses the adjustment arithmetic into a single
+# multithreaded pass without intermediate arrays
+try:
+    import numexpr as ne
+    ne.set_num_threads(os.cpu_count())
+except ImportError:
+    ne = None
+
+# Optional accelerator: joblib fans the per-race pipeline out across
+# processes when analyzing more than one race
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
 # Configuration
 CACHE_DIR = './cache'
 RACE_YEAR = 2025
@@ -31,6 +61,26 @@ TIRE_PERFORMANCE = {
     'WET': 3.0
 }
 
+# Columns actually used by the analysis; everything else FastF1 loads is dropped
+LAP_COLUMNS = ['Driver', 'LapNumber', 'LapTime', 'Compound', 'TyreLife']
+
+# Output dtypes for adjusted lap data: float32 keeps ~1e-5s precision on lap
+# times while halving the bytes every downstream aggregation has to move
+ADJUSTED_DTYPES = {
+    'Driver': 'category',
+    'LapNumber': 'int16',
+    'RawTime': 'float32',
+    'AdjustedTime': 'float32',
+    'Compound': 'category',
+    'TyreAge': 'float32',
+    'TotalAdjustment': 'float32'
+}
+
+# Fixed compound categories and the delta lookup as a Series, so the code
+# table can be realigned to whatever category order a column carries
+COMPOUND_DTYPE = pd.CategoricalDtype(list(TIRE_PERFORMANCE))
+TIRE_DELTA_MAP = pd.Series(TIRE_PERFORMANCE, dtype='float64')
+
 # Analysis parameters
 DEGRADATION_RATE = 0.1  # seconds per lap for intermediates in wet conditions
 MIN_LAPS_FOR_ANALYSIS = 3
@@ -43,16 +93,48 @@ def setup_cache():
         os.makedirs(CACHE_DIR)
     fastf1.Cache.enable_cache(CACHE_DIR)
 
-def load_session_data():
-    """Load race session data from FastF1."""
-    session = fastf1.get_session(RACE_YEAR, RACE_NAME, SESSION_TYPE)
-    session.load()
-    return session
+def _compound_delta_table(compound):
+    """Per-code delta array aligned to the column's actual categories.
 
-def analyze_race_overview(session):
+    Reindexing TIRE_DELTA_MAP keeps the gather correct even when a frame
+    (e.g. one read back from Parquet) carries its categories in a
+    different order; unknown compounds get a delta of 0.
+    """
+    return TIRE_DELTA_MAP.reindex(compound.cat.categories).fillna(0.0).to_numpy()
+
+def prepare_laps(laps):
+    """Project laps down to the analysis columns and compact dtypes."""
+    laps = laps[LAP_COLUMNS].copy()
+    laps['LapNumber'] = laps['LapNumber'].astype('int16')
+    laps['TyreLife'] = laps['TyreLife'].astype('float32')
+    laps['Compound'] = laps['Compound'].astype(COMPOUND_DTYPE)
+    return laps
+
+def _laps_cache_path(year, race_name):
+    """Cache file for the projected laps of one session."""
+    filename = f"laps_{year}_{race_name.replace(' ', '_')}_{SESSION_TYPE}.parquet"
+    return os.path.join(CACHE_DIR, filename)
+
+def load_session_data(year=RACE_YEAR, race_name=RACE_NAME):
+    """Load race session data from FastF1, reusing cached laps if present."""
+    session = fastf1.get_session(year, race_name, SESSION_TYPE)
+
+    # Event metadata comes from the schedule; the expensive session.load()
+    # only runs when the projected laps are not already on disk
+    cache_path = _laps_cache_path(year, race_name)
+    if os.path.exists(cache_path):
+        laps = prepare_laps(pd.read_parquet(cache_path))
+    else:
+        # Only laps are analyzed; skip telemetry, weather, and race control
+        session.load(laps=True, telemetry=False, weather=False, messages=False)
+        laps = prepare_laps(session.laps)
+        laps.to_parquet(cache_path, compression='snappy')
+
+    return session, laps
+
+def analyze_race_overview(session, laps):
     """Generate basic race statistics and tire usage."""
-    laps = session.laps
-    
+
     race_info = {
         'total_laps': len(laps),
         'event_name': session.event['EventName'],
@@ -60,123 +142,319 @@ def analyze_race_overview(session):
         'date': session.event['EventDate']
     }
     
-    # Tire compound analysis
+    # Tire compound analysis: value_counts drops NaN, percentages are
+    # computed in one vectorized multiply instead of per-compound division
     compound_usage = laps['Compound'].value_counts()
+    compound_usage = compound_usage[compound_usage > 0]
+    percentages = (compound_usage * (100.0 / len(laps))).round(1)
     race_info['compound_distribution'] = {
-        compound: {
-            'laps': count,
-            'percentage': round((count / len(laps)) * 100, 1)
-        }
-        for compound, count in compound_usage.items()
-        if pd.notna(compound)
+        compound: {'laps': int(count), 'percentage': float(pct)}
+        for compound, count, pct in zip(compound_usage.index,
+                                        compound_usage.to_numpy(),
+                                        percentages.to_numpy())
     }
     
-    return race_info, laps
+    return race_info
+
+def _calculate_adjusted_polars(valid_laps):
+    """Polars fast path: outlier filter and tire adjustment as one lazy query."""
+    compound_delta = (
+        pl.col('Compound').cast(pl.Utf8)
+        .replace_strict(TIRE_PERFORMANCE, default=0.0, return_dtype=pl.Float64)
+    )
+    adjusted = (
+        pl.from_pandas(valid_laps[LAP_COLUMNS]).lazy()
+        .with_columns((pl.col('LapTime').dt.total_microseconds() / 1_000_000)
+                      .alias('RawTime'))
+        .filter(pl.col('RawTime').is_between(OUTLIER_THRESHOLD_MIN,
+                                             OUTLIER_THRESHOLD_MAX))
+        .with_columns((compound_delta + pl.col('TyreLife') * DEGRADATION_RATE)
+                      .alias('TotalAdjustment'))
+        .with_columns((pl.col('RawTime') + pl.col('TotalAdjustment'))
+                      .alias('AdjustedTime'))
+        .rename({'TyreLife': 'TyreAge'})
+        .select(['Driver', 'LapNumber', 'RawTime', 'AdjustedTime',
+                 'Compound', 'TyreAge', 'TotalAdjustment'])
+        .collect()
+    )
+    return adjusted.to_pandas()
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _adjust_kernel(lap_seconds, codes, tyre_life, deltas, valid, adjustment):
+        for i in numba.prange(lap_seconds.shape[0]):
+            t = lap_seconds[i]
+            valid[i] = OUTLIER_THRESHOLD_MIN <= t <= OUTLIER_THRESHOLD_MAX
+            delta = deltas[codes[i]] if codes[i] >= 0 else 0.0
+            adjustment[i] = delta + tyre_life[i] * DEGRADATION_RATE
+
+def _calculate_adjusted_numba(valid_laps):
+    """Numba fast path: run outlier masking and adjustment over raw arrays."""
+    lap_seconds = valid_laps['LapTime'].dt.total_seconds().to_numpy()
+    codes = valid_laps['Compound'].cat.codes.to_numpy()
+    tyre_life = valid_laps['TyreLife'].to_numpy(np.float64)
+
+    valid = np.empty(lap_seconds.shape[0], dtype=np.bool_)
+    adjustment = np.empty(lap_seconds.shape[0], dtype=np.float64)
+    _adjust_kernel(lap_seconds, codes, tyre_life,
+                   _compound_delta_table(valid_laps['Compound']),
+                   valid, adjustment)
+
+    raw = np.compress(valid, lap_seconds)
+    total_adjustment = np.compress(valid, adjustment)
+    return pd.DataFrame({
+        'Driver': np.compress(valid, valid_laps['Driver'].to_numpy()),
+        'LapNumber': np.compress(valid, valid_laps['LapNumber'].to_numpy()),
+        'RawTime': raw,
+        'AdjustedTime': raw + total_adjustment,
+        'Compound': np.compress(valid, valid_laps['Compound'].to_numpy()),
+        'TyreAge': np.compress(valid, tyre_life),
+        'TotalAdjustment': total_adjustment
+    })
 
 def calculate_tire_adjusted_times(laps):
     """Calculate tire-adjusted lap times for valid racing laps."""
-    valid_laps = laps.dropna(subset=['LapTime', 'Compound', 'TyreLife']).copy()
-    valid_laps['LapTimeSeconds'] = valid_laps['LapTime'].dt.total_seconds()
-    
-    adjusted_data = []
-    
-    for _, lap in valid_laps.iterrows():
-        lap_time = lap['LapTimeSeconds']
-        
-        # Filter outliers (pit stops, crashes, safety car periods)
-        if lap_time < OUTLIER_THRESHOLD_MIN or lap_time > OUTLIER_THRESHOLD_MAX:
-            continue
-        
-        # Calculate adjustments
-        compound_adjustment = TIRE_PERFORMANCE.get(lap['Compound'], 0)
-        age_penalty = lap['TyreLife'] * DEGRADATION_RATE
-        total_adjustment = compound_adjustment + age_penalty
-        
-        # Normalize to fresh intermediate baseline
-        adjusted_time = lap_time + total_adjustment
-        
-        adjusted_data.append({
-            'Driver': lap['Driver'],
-            'LapNumber': lap['LapNumber'],
-            'RawTime': lap_time,
-            'AdjustedTime': adjusted_time,
-            'Compound': lap['Compound'],
-            'TyreAge': lap['TyreLife'],
-            'TotalAdjustment': total_adjustment
-        })
-    
-    return pd.DataFrame(adjusted_data)
+    # No .copy() needed: nothing below writes back into the frame, all
+    # derived values live in local arrays
+    valid_laps = laps.dropna(subset=['LapTime', 'Compound', 'TyreLife'])
+
+    if pl is not None:
+        return _calculate_adjusted_polars(valid_laps).astype(ADJUSTED_DTYPES)
+    if numba is not None:
+        return _calculate_adjusted_numba(valid_laps).astype(ADJUSTED_DTYPES)
+
+    # Extract the needed columns as contiguous typed arrays once; all of
+    # the masking and arithmetic below stays on these flat arrays and a
+    # DataFrame is only rebuilt at the reporting boundary
+    lap_seconds = valid_laps['LapTime'].dt.total_seconds().to_numpy()
+    drivers = valid_laps['Driver'].to_numpy()
+    lap_numbers = valid_laps['LapNumber'].to_numpy(np.int16)
+    compounds = valid_laps['Compound'].to_numpy()
+    compound_codes = valid_laps['Compound'].cat.codes.to_numpy()
+    tyre_life = valid_laps['TyreLife'].to_numpy(np.float32)
+
+    # Filter outliers (pit stops, crashes, safety car periods) with a
+    # branchless fused comparison over the raw array
+    mask = np.logical_and(lap_seconds >= OUTLIER_THRESHOLD_MIN,
+                          lap_seconds <= OUTLIER_THRESHOLD_MAX)
+    lap_seconds = np.compress(mask, lap_seconds)
+    drivers = np.compress(mask, drivers)
+    lap_numbers = np.compress(mask, lap_numbers)
+    compounds = np.compress(mask, compounds)
+    compound_codes = np.compress(mask, compound_codes)
+    tyre_life = np.compress(mask, tyre_life)
+
+    # Calculate adjustments, normalizing to fresh intermediate baseline;
+    # the compound delta is a single array gather on the categorical codes
+    compound_adjustment = _compound_delta_table(valid_laps['Compound'])[compound_codes]
+    if ne is not None:
+        total_adjustment = ne.evaluate(
+            'compound_adjustment + tyre_life * rate',
+            local_dict={'compound_adjustment': compound_adjustment,
+                        'tyre_life': tyre_life,
+                        'rate': DEGRADATION_RATE})
+    else:
+        total_adjustment = compound_adjustment + tyre_life * DEGRADATION_RATE
+
+    return pd.DataFrame({
+        'Driver': drivers,
+        'LapNumber': lap_numbers,
+        'RawTime': lap_seconds,
+        'AdjustedTime': lap_seconds + total_adjustment,
+        'Compound': compounds,
+        'TyreAge': tyre_life,
+        'TotalAdjustment': total_adjustment
+    }).astype(ADJUSTED_DTYPES)
+
+def _params_fingerprint():
+    """Fingerprint of the tuning parameters, used to key cached results."""
+    params = (TIRE_PERFORMANCE, DEGRADATION_RATE,
+              OUTLIER_THRESHOLD_MIN, OUTLIER_THRESHOLD_MAX)
+    return hashlib.md5(repr(params).encode()).hexdigest()[:8]
+
+def _adjusted_cache_root():
+    """Root of the partitioned adjusted-lap cache for the current tuning."""
+    return os.path.join(CACHE_DIR, 'adjusted', _params_fingerprint())
+
+def _adjusted_cache_path(year, race_name):
+    """Cache file for adjusted lap data, partitioned by year and race."""
+    return os.path.join(_adjusted_cache_root(), f'year={year}',
+                        f"race={race_name.replace(' ', '_')}", 'part.parquet')
 
 def define_race_segments():
     """Define race segments based on track conditions."""
     return [
         {
             'name': 'Early Wet Chaos',
-            'laps': range(1, 16),
+            'start_lap': 1,
+            'end_lap': 16,
             'description': 'Formation lap tire decisions, standing water'
         },
         {
             'name': 'Heavy Rain Period',
-            'laps': range(16, 35),
+            'start_lap': 16,
+            'end_lap': 35,
             'description': 'Safety car periods, maximum spray conditions'
         },
         {
             'name': 'Drying Phase',
-            'laps': range(35, 50),
+            'start_lap': 35,
+            'end_lap': 50,
             'description': 'Track evolution, strategic tire transitions'
         }
     ]
 
-def analyze_segment_performance(adjusted_df, segments, target_drivers):
-    """Analyze tire-adjusted performance by race segment."""
-    results = {}
-    
-    for segment in segments:
-        segment_data = adjusted_df[
-            (adjusted_df['LapNumber'].isin(segment['laps'])) &
-            (adjusted_df['Driver'].isin(target_drivers))
-        ]
-        
-        driver_performance = []
-        
-        for driver in target_drivers:
-            driver_laps = segment_data[segment_data['Driver'] == driver]
-            
-            if len(driver_laps) >= MIN_LAPS_FOR_ANALYSIS:
-                performance_metrics = {
-                    'driver': driver,
-                    'avg_adjusted_time': driver_laps['AdjustedTime'].mean(),
-                    'lap_count': len(driver_laps),
-                    'consistency': driver_laps['AdjustedTime'].std(),
-                    'best_lap': driver_laps['AdjustedTime'].min()
-                }
-                driver_performance.append(performance_metrics)
-        
-        # Sort by average adjusted time
-        driver_performance.sort(key=lambda x: x['avg_adjusted_time'])
-        results[segment['name']] = driver_performance
-    
-    return results
+if numba is not None:
+    @numba.njit(cache=True)
+    def _group_stats_kernel(values, starts, counts, means, stds, mins):
+        for g in range(starts.shape[0] - 1):
+            n = 0
+            mean = 0.0
+            m2 = 0.0
+            best = np.inf
+            for i in range(starts[g], starts[g + 1]):
+                x = values[i]
+                n += 1
+                delta = x - mean
+                mean += delta / n
+                m2 += delta * (x - mean)
+                if x < best:
+                    best = x
+            counts[g] = n
+            means[g] = mean
+            stds[g] = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+            mins[g] = best
+
+def _segment_stats_numba(target_laps):
+    """Compute count/mean/std/min per (Segment, Driver) in one fused pass."""
+    target_laps = target_laps.dropna(subset=['Segment'])
+    if target_laps.empty:
+        return pd.DataFrame({
+            'Segment': target_laps['Segment'].array,
+            'Driver': target_laps['Driver'].to_numpy(),
+            'avg_adjusted_time': np.empty(0),
+            'consistency': np.empty(0),
+            'best_lap': np.empty(0),
+            'lap_count': np.empty(0, dtype=np.int64)
+        })
+
+    group_codes = (target_laps.groupby(['Segment', 'Driver'], observed=True)
+                   .ngroup().to_numpy())
+    order = np.argsort(group_codes, kind='stable')
+    values = target_laps['AdjustedTime'].to_numpy(np.float64)[order]
+    sorted_codes = group_codes[order]
+
+    # Offsets of each group within the sorted value array
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    starts = np.append(starts, sorted_codes.shape[0])
+
+    n_groups = starts.shape[0] - 1
+    counts = np.empty(n_groups, dtype=np.int64)
+    means = np.empty(n_groups, dtype=np.float64)
+    stds = np.empty(n_groups, dtype=np.float64)
+    mins = np.empty(n_groups, dtype=np.float64)
+    _group_stats_kernel(values, starts, counts, means, stds, mins)
+
+    first_rows = order[starts[:-1]]
+    return pd.DataFrame({
+        'Segment': target_laps['Segment'].iloc[first_rows].array,
+        'Driver': target_laps['Driver'].to_numpy()[first_rows],
+        'avg_adjusted_time': means,
+        'consistency': stds,
+        'best_lap': mins,
+        'lap_count': counts
+    })
+
+def assign_segments(adjusted_df, segments):
+    """Label each adjusted lap with its race segment, once, as a category."""
+    intervals = pd.IntervalIndex.from_tuples(
+        [(segment['start_lap'], segment['end_lap']) for segment in segments],
+        closed='left')
+    segment_col = pd.cut(adjusted_df['LapNumber'], bins=intervals)
+    adjusted_df['Segment'] = segment_col.cat.rename_categories(
+        [segment['name'] for segment in segments])
+    return adjusted_df
+
+def _segment_stats_polars(segments, target_drivers, cache_path):
+    """Stream one race's cached laps through a lazy filter/cut/group query."""
+    labels = [segment['name'] for segment in segments]
+    breaks = [segment['start_lap'] for segment in segments[1:]]
+    first_lap = segments[0]['start_lap']
+    last_lap = segments[-1]['end_lap']
+
+    stats = (
+        pl.scan_parquet(cache_path)
+        .filter(pl.col('Driver').is_in(target_drivers))
+        .filter((pl.col('LapNumber') >= first_lap) &
+                (pl.col('LapNumber') < last_lap))
+        .with_columns(pl.col('LapNumber')
+                      .cut(breaks, labels=labels, left_closed=True)
+                      .alias('Segment'))
+        .group_by(['Segment', 'Driver'])
+        .agg(avg_adjusted_time=pl.col('AdjustedTime').mean(),
+             consistency=pl.col('AdjustedTime').std(),
+             best_lap=pl.col('AdjustedTime').min(),
+             lap_count=pl.len())
+        .collect(engine='streaming')
+        .to_pandas()
+    )
+    # Restore race ordering of segments for downstream sorting and display
+    stats['Segment'] = stats['Segment'].astype(
+        pd.CategoricalDtype(labels, ordered=True))
+    return stats
+
+def analyze_segment_performance(adjusted_df, segments, target_drivers,
+                                year=RACE_YEAR, race_name=RACE_NAME):
+    """Analyze tire-adjusted performance by race segment.
+
+    Expects the persistent 'Segment' category from assign_segments; laps
+    outside every segment carry NaN and fall out of the grouping. The
+    streaming path reads only the named race's cache partition so stats
+    never mix laps from other cached races.
+    """
+    cache_path = _adjusted_cache_path(year, race_name)
+    if pl is not None and os.path.exists(cache_path):
+        stats = _segment_stats_polars(segments, target_drivers, cache_path)
+        stats = stats[stats['lap_count'] >= MIN_LAPS_FOR_ANALYSIS]
+        return stats.sort_values(['Segment', 'avg_adjusted_time']).reset_index(drop=True)
+
+    target_laps = adjusted_df[adjusted_df['Driver'].isin(target_drivers)]
 
-def generate_performance_summary(segment_results):
+    if numba is not None:
+        stats = _segment_stats_numba(target_laps)
+    else:
+        stats = (
+            target_laps
+            .groupby(['Segment', 'Driver'], observed=True)
+            .agg(avg_adjusted_time=('AdjustedTime', 'mean'),
+                 consistency=('AdjustedTime', 'std'),
+                 best_lap=('AdjustedTime', 'min'),
+                 lap_count=('AdjustedTime', 'size'))
+            .reset_index()
+        )
+    stats = stats[stats['lap_count'] >= MIN_LAPS_FOR_ANALYSIS]
+    return stats.sort_values(['Segment', 'avg_adjusted_time']).reset_index(drop=True)
+
+def generate_performance_summary(segment_stats):
     """Generate summary of performance trends across segments."""
-    driver_evolution = {}
-    
-    for segment_name, results in segment_results.items():
-        for i, driver_data in enumerate(results):
-            driver = driver_data['driver']
-            position = i + 1
-            
-            if driver not in driver_evolution:
-                driver_evolution[driver] = []
-            
-            driver_evolution[driver].append({
-                'segment': segment_name,
-                'position': position,
-                'gap_to_leader': driver_data['avg_adjusted_time'] - results[0]['avg_adjusted_time']
-            })
-    
-    return driver_evolution
+    summary = segment_stats.copy()
+    summary['position'] = (
+        summary.groupby('Segment', observed=True)['avg_adjusted_time']
+        .rank(method='first').astype(int)
+    )
+    summary['gap_to_leader'] = (
+        summary['avg_adjusted_time'] -
+        summary.groupby('Segment', observed=True)['avg_adjusted_time'].transform('min')
+    )
+
+    driver_evolution = {
+        driver: group.rename(columns={'Segment': 'segment'})
+                     [['segment', 'position', 'gap_to_leader']]
+                     .to_dict('records')
+        for driver, group in summary.groupby('Driver', observed=True)
+    }
+
+    return summary, driver_evolution
 
 def print_results(race_info, segment_results, driver_evolution):
     """Output analysis results."""
@@ -192,18 +470,16 @@ def print_results(race_info, segment_results, driver_evolution):
     print()
     
     print("Segment Analysis Results:")
-    for segment_name, results in segment_results.items():
-        print(f"\n{segment_name}:")
-        
-        if results:
-            fastest_time = results[0]['avg_adjusted_time']
-            
-            for i, perf in enumerate(results):
-                gap = perf['avg_adjusted_time'] - fastest_time
-                gap_str = "REF" if gap < 0.05 else f"+{gap:.2f}s"
-                
-                print(f"  {i+1}. {perf['driver']}: {gap_str} "
-                      f"({perf['lap_count']} laps)")
+    current_segment = None
+    ordered = segment_results.sort_values(['Segment', 'position'])
+    for row in ordered.itertuples(index=False):
+        if row.Segment != current_segment:
+            current_segment = row.Segment
+            print(f"\n{current_segment}:")
+
+        gap_str = "REF" if row.gap_to_leader < 0.05 else f"+{row.gap_to_leader:.2f}s"
+        print(f"  {row.position}. {row.Driver}: {gap_str} "
+              f"({row.lap_count} laps)")
     
     print(f"\nPerformance Evolution:")
     for driver, evolution in driver_evolution.items():
@@ -211,24 +487,34 @@ def print_results(race_info, segment_results, driver_evolution):
         avg_position = sum(positions) / len(positions)
         print(f"  {driver}: Average P{avg_position:.1f}")
 
-def main():
-    """Execute complete tire-adjusted pace analysis."""
-    # Setup
+def main(year=RACE_YEAR, race_name=RACE_NAME):
+    """Execute complete tire-adjusted pace analysis for one race."""
+    # Setup (each worker process enables its own cache handle)
     setup_cache()
-    
+
     # Load and process data
-    session = load_session_data()
-    race_info, laps = analyze_race_overview(session)
-    adjusted_df = calculate_tire_adjusted_times(laps)
+    session, laps = load_session_data(year, race_name)
+    race_info = analyze_race_overview(session, laps)
+
+    # Skip the adjustment pipeline entirely on warm re-runs
+    cache_path = _adjusted_cache_path(year, race_name)
+    if os.path.exists(cache_path):
+        adjusted_df = pd.read_parquet(cache_path)
+    else:
+        adjusted_df = calculate_tire_adjusted_times(laps)
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        adjusted_df.to_parquet(cache_path, compression='snappy')
     
     # Define analysis parameters
     segments = define_race_segments()
     target_drivers = ['NOR', 'PIA', 'VER', 'HAM', 'HUL', 'STR']
-    
+    adjusted_df = assign_segments(adjusted_df, segments)
+
     # Perform analysis
-    segment_results = analyze_segment_performance(adjusted_df, segments, target_drivers)
-    driver_evolution = generate_performance_summary(segment_results)
-    
+    segment_stats = analyze_segment_performance(adjusted_df, segments,
+                                                target_drivers, year, race_name)
+    segment_results, driver_evolution = generate_performance_summary(segment_stats)
+
     # Output results
     print_results(race_info, segment_results, driver_evolution)
     
@@ -241,5 +527,17 @@ def main():
         'driver_evolution': driver_evolution
     }
 
+def analyze_season(race_names, year=RACE_YEAR):
+    """Run the full analysis for several races of a season.
+
+    The races are independent, so with joblib available they run in
+    separate processes; FastF1's cache writes atomically and is safe to
+    share between workers.
+    """
+    if joblib is not None:
+        return joblib.Parallel(n_jobs=-1, backend='loky')(
+            joblib.delayed(main)(year, race_name) for race_name in race_names)
+    return [main(year, race_name) for race_name in race_names]
+
 if __name__ == "__main__":
     analysis_results = main()
\ No newline at end of file